@@ -1,6 +1,6 @@
 import inspect
 from functools import wraps
-from typing import TypeVar, Optional, Union, Dict, List, Iterable, Callable
+from typing import TypeVar, Optional, Union, Dict, List, Iterable, Callable, Set, Tuple
 
 try:
     from .pdflib_py import *
@@ -39,25 +39,178 @@ def wrap_optlist(fn: Callable):
     return new_fn
 
 
+def optlist_items(optlist: Optlist) -> List[Tuple[str, Optional[str]]]:
+    """Top-level (option, value) pairs of an optlist. Option names are lowercased, as PDFlib
+    treats them case-insensitively. Understands both `key=value` and `key value`; anything nested
+    in braces (suboption lists, string values) is part of a value. A boolean option without a value
+    is only recognised at the end of the optlist or before a `key=value` pair, e.g. in
+    `embedding subsetting=false`. In `embedding subsetting`, subsetting is read as the value."""
+    if isinstance(optlist, dict):
+        return [(k.lower(), PDFlib._coerce_value(v)) for k, v in optlist.items()]
+
+    # Split into top-level tokens, remembering which ones are followed by '='
+    tokens: List[List] = []
+    depth = 0
+    current = ''
+    for char in optlist:
+        if depth == 0 and (char.isspace() or char == '='):
+            if current:
+                tokens.append([current, False])
+                current = ''
+            if char == '=' and tokens:
+                tokens[-1][1] = True
+            continue
+        if char == '{':
+            depth += 1
+        elif char == '}':
+            depth = max(depth - 1, 0)
+        current += char
+    if current:
+        tokens.append([current, False])
+
+    items = []
+    i = 0
+    while i < len(tokens):
+        key, has_value = tokens[i]
+        value = None
+        i += 1
+        # Take the value, unless it was omitted and the next token is already another key
+        if i < len(tokens) and (has_value or not tokens[i][1]):
+            value = tokens[i][0]
+            i += 1
+        items.append((key.lower(), value))
+    return items
+
+
+def optlist_keys(optlist: Optlist) -> List[str]:
+    """Lowercased top-level option names of an optlist, see optlist_items()"""
+    return [k for k, v in optlist_items(optlist)]
+
+
+# Standard fonts PDFlib can use without an outline file, which therefore can't be embedded or subset by default
+CORE_FONTS = frozenset([
+    'courier', 'courier-bold', 'courier-oblique', 'courier-boldoblique',
+    'helvetica', 'helvetica-bold', 'helvetica-oblique', 'helvetica-boldoblique',
+    'times-roman', 'times-bold', 'times-italic', 'times-bolditalic',
+    'symbol', 'zapfdingbats',
+])
+
+
+class OutputProfile:
+    """Named set of output tuning options. Each optlist is merged into the
+    matching PDFlib call; options the caller passes explicitly always win.
+
+    document: begin_document() optlist
+    option: set_option() optlist, applied right after begin_document() and reverted by end_document().
+        Numeric options only, as get_option() can't read other kinds back for restoring.
+    font: load_font() optlist, also merged into the optlists of fit_textline(), add_textflow(),
+        create_textflow(), add_table_cell() and set_text_option() when they load a font with a
+        top-level fontname. Fonts named in suboptions or inline textflow options are not covered.
+    image: load_image() optlist"""
+
+    def __init__(
+        self,
+        name: str,
+        document: Optional[Dict[str, OptlistValue]] = None,
+        option: Optional[Dict[str, OptlistValue]] = None,
+        font: Optional[Dict[str, OptlistValue]] = None,
+        image: Optional[Dict[str, OptlistValue]] = None
+    ):
+        self.name = name
+        self.document = document or {}
+        self.option = option or {}
+        for k, v in self.option.items():
+            if isinstance(v, bool) or not isinstance(v, (float, int)):
+                raise TypeError('OutputProfile option %s must be numeric, got %r' % (k, v))
+        self.font = font or {}
+        self.image = image or {}
+
+    def __repr__(self):
+        return '<OutputProfile %s>' % self.name
+
+
+OUTPUT_PROFILES: Dict[str, OutputProfile] = {
+    # Minimal CPU: light deflate, no object streams, no subsetting, images passed through as-is
+    'fast': OutputProfile(
+        'fast',
+        document={'objectstreams': 'none'},
+        option={'compress': 1},
+        font={'subsetting': False},
+        image={'passthrough': True},
+    ),
+    # PDFlib defaults, stated explicitly
+    'balanced': OutputProfile(
+        'balanced',
+        option={'compress': 6},
+    ),
+    # Maximum deflate, object streams, fonts always subset. Images are left alone: recompressing
+    # already compressed data (e.g. JPEG) with Flate makes it larger, not smaller.
+    'smallest': OutputProfile(
+        'smallest',
+        document={'objectstreams': ['other']},
+        option={'compress': 9},
+        font={'subsetting': True},
+    ),
+    # Fully embedded fonts so the output stays editable, original image data kept intact.
+    # Embedding and subsetting are not forced for the CORE_FONTS, which need a configured outline file.
+    # Fonts whose license forbids embedding still fail to load under this profile.
+    # Does not imply PDF/A; pass pdfa=... to begin_document() for that.
+    'archive': OutputProfile(
+        'archive',
+        option={'compress': 9},
+        font={'embedding': True, 'subsetting': False},
+        image={'passthrough': True},
+    ),
+}
+
+
 class PDFlib:
 
     __p: Optional[PDFlibInstance] = None
 
     _fonts: FontMap
     _debug: bool = False
+    _profile: Optional[OutputProfile] = None
+    # Snapshot of _profile taken by begin_document(), used until end_document()
+    _document_profile: Optional[OutputProfile] = None
+    _in_document: bool = False
+    # Option keys the caller set via set_option(); the profile never overrides these
+    _caller_options: Set[str]
+    # Values the profile's set_option() options replaced, put back by end_document()
+    _restore_options: Dict[str, InfoResult]
 
     # Warning: this is most likely incorrect after save()/restore() calls
     _font_size: int = 0
 
-    def __init__(self):
+    def __init__(self, profile: Union[str, OutputProfile, None] = None):
         self.__p = PDF_new()
         if self.__p:
             PDF_set_option(self.__p, "objorient=true")
         self._fonts = {}
+        self._caller_options = set()
+        self._restore_options = {}
+        self.use_profile(profile)
 
     def debug(self, enable: bool):
         self._debug = enable
 
+    def use_profile(self, profile: Union[str, OutputProfile, None]):
+        """Select the output profile applied to begin_document(), load_font() and load_image().
+        Accepts a key of OUTPUT_PROFILES, an OutputProfile instance, or None to disable.
+        Takes effect from the next begin_document() call, an open document keeps the profile
+        it was started with."""
+        if isinstance(profile, str):
+            try:
+                profile = OUTPUT_PROFILES[profile]
+            except KeyError:
+                raise ValueError('Unknown output profile %s, expected one of: %s'
+                                 % (profile, ', '.join(OUTPUT_PROFILES))) from None
+        self._profile = profile
+
+    @property
+    def profile(self) -> Optional[OutputProfile]:
+        return self._profile
+
     @classmethod
     def parse_optlist(cls, optlist: Dict[str, OptlistValue]) -> str:
         out = []
@@ -99,6 +252,61 @@ class PDFlib:
                 optlist += ' showborder=true'
         return optlist
 
+    def _active_profile(self) -> Optional[OutputProfile]:
+        return self._document_profile if self._in_document else self._profile
+
+    def profile_optlist(self, kind: str, optlist: Optlist, exclude: Iterable[str] = ()) -> Optlist:
+        """Merge the active output profile's options for `kind` (document, option, font, image)
+        into optlist. Options already specified in optlist, or listed in exclude, are left untouched.
+        The profile's options go first, so on a clash PDFlib uses the caller's value."""
+        if self._active_profile() is None:
+            return optlist
+        if isinstance(optlist, dict):
+            optlist = self.parse_optlist(optlist)
+        return ' '.join(self._profile_options(kind, optlist, exclude) + [optlist]).strip()
+
+    def _profile_options(self, kind: str, optlist: str, exclude: Iterable[str] = ()) -> List[str]:
+        profile = self._active_profile()
+        if profile is None:
+            return []
+        skip = set(optlist_keys(optlist)).union(k.lower() for k in exclude)
+        out = []
+        for k, v in getattr(profile, kind).items():
+            if k.lower() not in skip:
+                out.append('%s=%s' % (k, self._coerce_value(v)))
+        return out
+
+    def _font_exclude(self, fontname: str) -> List[str]:
+        # Core fonts have no outline file to embed or subset unless one is configured
+        return ['embedding', 'subsetting'] if fontname.strip('{}').lower() in CORE_FONTS else []
+
+    def font_profile_optlist(self, optlist: Optlist) -> Optlist:
+        """Merge the active output profile's font options into an optlist which loads a font
+        implicitly via a top-level fontname. Other optlists are returned unchanged."""
+        fontname = dict(optlist_items(optlist)).get('fontname')
+        if fontname is None:
+            return optlist
+        return self.profile_optlist('font', optlist, self._font_exclude(fontname))
+
+    def _replaced_profile_options(self, optlist: str) -> Dict[str, InfoResult]:
+        """Current values of the options the profile's set_option() options will replace.
+        Options given to begin_document() or to earlier set_option() calls take precedence."""
+        if self._profile is None:
+            return {}
+        skip = self._caller_options.union(optlist_keys(optlist))
+        replaced = {}
+        for k in self._profile.option:
+            if k.lower() not in skip:
+                replaced[k] = PDF_get_option(self.__p, k, '')
+        return replaced
+
+    def _restore_profile_options(self):
+        for k, v in self._restore_options.items():
+            if isinstance(v, float) and v.is_integer():
+                v = int(v)
+            PDF_set_option(self.__p, '%s=%s' % (k, self._coerce_value(v)))
+        self._restore_options = {}
+
     # It is recommended not to use __del__ as it's execution is not guaranteed in a timely fashion.
     # Implement a delete method to invalidate self.__p
     def __del__(self):
@@ -139,11 +347,13 @@ class PDFlib:
         text: str,
         optlist: Optlist = ''
     ) -> Handle:
+        optlist = self.font_profile_optlist(optlist)
         optlist = self.box_debug(optlist)
         return PDF_add_table_cell(self.__p, table, column, row, text, optlist)
 
     @wrap_optlist
     def add_textflow(self, textflow: Handle, text: str, optlist: Optlist = '') -> Handle:
+        optlist = self.font_profile_optlist(optlist)
         return PDF_add_textflow(self.__p, textflow, text, optlist)
 
     def align(self, dx: float, dy: float):
@@ -156,8 +366,20 @@ class PDFlib:
         PDF_arcn(self.__p, x, y, r, alpha, beta)
 
     @wrap_optlist
-    def begin_document(self, filename: str, optlist: Optlist = ''):
-        PDF_begin_document(self.__p, filename, optlist)
+    def begin_document(self, filename: str, optlist: Optlist = '') -> int:
+        self._restore_profile_options()
+        optlist = self.profile_optlist('document', optlist)
+        # Read everything up front, so a failing get_option() can't leave the profile half applied
+        replaced = self._replaced_profile_options(optlist)
+        result = PDF_begin_document(self.__p, filename, optlist)
+        if result == -1:
+            return result
+        self._document_profile = self._profile
+        self._in_document = True
+        for k in replaced:
+            PDF_set_option(self.__p, '%s=%s' % (k, self._coerce_value(self._profile.option[k])))
+        self._restore_options = replaced
+        return result
 
     @wrap_optlist
     def begin_dpart(self, optlist: Optlist = ''):
@@ -292,6 +514,7 @@ class PDFlib:
 
     @wrap_optlist
     def create_textflow(self, text: str, optlist: Optlist = ''):
+        optlist = self.font_profile_optlist(optlist)
         return PDF_create_textflow(self.__p, text, optlist)
 
     def curveto(self, x1: float, y1: float, x2: float, y2: float, x3: float, y3: float):
@@ -329,6 +552,9 @@ class PDFlib:
     @wrap_optlist
     def end_document(self, optlist: Optlist = ''):
         PDF_end_document(self.__p, optlist)
+        self._document_profile = None
+        self._in_document = False
+        self._restore_profile_options()
 
     @wrap_optlist
     def end_dpart(self, optlist: Optlist = ''):
@@ -405,6 +631,7 @@ class PDFlib:
 
     @wrap_optlist
     def fit_textline(self, text: str, x: float, y: float, optlist: Optlist = ''):
+        optlist = self.font_profile_optlist(optlist)
         optlist = self.box_debug(optlist)
         PDF_fit_textline(self.__p, text, x, y, optlist)
 
@@ -477,6 +704,7 @@ class PDFlib:
 
     @wrap_optlist
     def load_font(self, fontname: str, encoding: str, optlist: Optlist = '') -> Handle:
+        optlist = self.profile_optlist('font', optlist, self._font_exclude(fontname))
         return PDF_load_font(self.__p, fontname, encoding, optlist)
 
     @wrap_optlist
@@ -512,6 +740,7 @@ class PDFlib:
 
     @wrap_optlist
     def load_image(self, imagetype: str, filename: str, optlist: Optlist = '') -> Handle:
+        optlist = self.profile_optlist('image', optlist)
         return PDF_load_image(self.__p, imagetype, filename, optlist)
 
     def makespotcolor(self, spotname: str) -> Handle:
@@ -564,9 +793,14 @@ class PDFlib:
     @wrap_optlist
     def set_option(self, optlist: Optlist = ''):
         PDF_set_option(self.__p, optlist)
+        keys = optlist_keys(optlist)
+        self._caller_options.update(keys)
+        # The caller's own setting outlives the document, end_document() must not undo it
+        self._restore_options = {k: v for k, v in self._restore_options.items() if k.lower() not in keys}
 
     @wrap_optlist
     def set_text_option(self, optlist: Optlist = ''):
+        optlist = self.font_profile_optlist(optlist)
         PDF_set_text_option(self.__p, optlist)
 
     def set_text_pos(self, x: float, y: float):
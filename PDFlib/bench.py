@@ -0,0 +1,153 @@
+"""Size-vs-speed harness for output profiles.
+
+Runs a corpus of render scripts under each output profile and reports generation
+time, peak memory and output size. A render script is a Python file defining
+
+    def render(p: PDFlib):
+        ...
+
+which draws its pages into an already open in-memory document. The harness owns
+begin_document()/end_document(), so the profile is the only thing that varies.
+
+    python -m PDFlib.bench scripts/*.py --profile fast --profile smallest --repeat 5
+
+Without scripts, the bundled corpus in PDFlib/bench_scripts is used: text-heavy, font-heavy
+(TrueType fonts, see PDFLIB_BENCH_FONTS) and image-heavy (see PDFLIB_BENCH_IMAGES) workloads.
+
+Every run happens in a freshly spawned (not forked) worker process, so peak memory
+(max RSS, which covers allocations made by the PDFlib library itself) is not polluted
+by earlier runs or by the harness. It does include the interpreter's own baseline,
+which is the same for every run.
+"""
+import argparse
+import glob
+import json
+import multiprocessing
+import os
+import runpy
+import statistics
+import sys
+import time
+from typing import Dict, List, Optional, Sequence
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+from . import PDFlib, OUTPUT_PROFILES
+
+BENCH_SCRIPTS = os.path.join(os.path.dirname(__file__), 'bench_scripts')
+
+
+def _peak_rss() -> Optional[int]:
+    """Peak resident set size of the current process in bytes, if the platform reports it"""
+    if resource is None:
+        return None
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports kilobytes, macOS reports bytes
+    return rss if sys.platform == 'darwin' else rss * 1024
+
+
+def run_script(script: str, profile: str) -> Dict[str, object]:
+    """Render `script` once under `profile` in the current process"""
+    render = runpy.run_path(script)['render']
+    p = PDFlib(profile=profile)
+    try:
+        start = time.perf_counter()
+        p.begin_document('', '')
+        render(p)
+        p.end_document('')
+        data = p.get_buffer()
+        elapsed = time.perf_counter() - start
+    finally:
+        p.delete()
+    return {
+        'seconds': elapsed,
+        'peak_rss': _peak_rss(),
+        'bytes': len(data),
+    }
+
+
+def benchmark(scripts: Sequence[str], profiles: Sequence[str], repeat: int = 3) -> List[Dict[str, object]]:
+    """Run every script under every profile `repeat` times, each run in a fresh process.
+    Reports the median time, the highest peak RSS and the smallest and largest output size
+    per combination. The sizes only differ if the script's output isn't deterministic."""
+    # A forked child inherits the parent's ru_maxrss, a spawned one starts from scratch
+    context = multiprocessing.get_context('spawn')
+    results = []
+    for script in scripts:
+        for profile in profiles:
+            runs = []
+            for _ in range(repeat):
+                with context.Pool(processes=1, maxtasksperchild=1) as pool:
+                    runs.append(pool.apply(run_script, (script, profile)))
+            rss = [r['peak_rss'] for r in runs if r['peak_rss'] is not None]
+            sizes = [r['bytes'] for r in runs]
+            results.append({
+                'script': script,
+                'profile': profile,
+                'seconds': statistics.median(r['seconds'] for r in runs),
+                'peak_rss': max(rss) if rss else None,
+                'bytes': min(sizes),
+                'bytes_max': max(sizes),
+            })
+    return results
+
+
+def _format_size(smallest: int, largest: int) -> str:
+    if smallest == largest:
+        return '%.1f' % (smallest / 1024)
+    return '%.1f-%.1f' % (smallest / 1024, largest / 1024)
+
+
+def format_table(results: List[Dict[str, object]]) -> str:
+    header = ('script', 'profile', 'time (ms)', 'peak RSS (MiB)', 'output (KiB)')
+    rows = [header]
+    for r in results:
+        rows.append((
+            os.path.basename(r['script']),
+            r['profile'],
+            '%.1f' % (r['seconds'] * 1000),
+            '-' if r['peak_rss'] is None else '%.1f' % (r['peak_rss'] / 1024 / 1024),
+            _format_size(r['bytes'], r['bytes_max']),
+        ))
+    widths = [max(len(row[i]) for row in rows) for i in range(len(header))]
+    lines = []
+    for row in rows:
+        cells = [row[0].ljust(widths[0]), row[1].ljust(widths[1])]
+        cells += [cell.rjust(width) for cell, width in zip(row[2:], widths[2:])]
+        lines.append('  '.join(cells))
+    lines.insert(1, '  '.join('-' * width for width in widths))
+    return '\n'.join(lines)
+
+
+def main(argv: Optional[Sequence[str]] = None):
+    parser = argparse.ArgumentParser(prog='python -m PDFlib.bench', description=__doc__.split('\n')[0])
+    parser.add_argument('scripts', nargs='*', help='render scripts, each defining render(p) (default: bundled corpus)')
+    parser.add_argument('--profile', action='append', choices=list(OUTPUT_PROFILES), dest='profiles',
+                        help='profile to benchmark, may be repeated (default: all)')
+    parser.add_argument('--repeat', type=int, default=3, help='runs per script and profile (default: 3)')
+    parser.add_argument('--json', action='store_true', help='emit results as JSON instead of a table')
+    args = parser.parse_args(argv)
+    if not args.scripts:
+        args.scripts = sorted(glob.glob(os.path.join(BENCH_SCRIPTS, '*.py')))
+    if args.repeat < 1:
+        parser.error('--repeat must be at least 1')
+    for script in args.scripts:
+        try:
+            namespace = runpy.run_path(script)
+        except (OSError, SyntaxError) as exc:
+            parser.error('could not load %s: %s' % (script, exc))
+        if not callable(namespace.get('render')):
+            parser.error('%s does not define render(p)' % script)
+
+    results = benchmark(args.scripts, args.profiles or list(OUTPUT_PROFILES), args.repeat)
+    if args.json:
+        print(json.dumps(results, indent=2))
+    else:
+        print(format_table(results))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,58 @@
+"""Font-heavy workload: several TrueType fonts with a small glyph repertoire each, so embedding
+and subsetting dominate the output size.
+
+Fonts are taken from the directories in PDFLIB_BENCH_FONTS (os.pathsep separated), falling back
+to the usual system font directories.
+"""
+import os
+
+FONT_DIRS = [
+    '/usr/share/fonts',
+    '/usr/local/share/fonts',
+    '/Library/Fonts',
+    '/System/Library/Fonts',
+    'C:\\Windows\\Fonts',
+]
+FONT_COUNT = 6
+PAGES = 5
+SAMPLE = 'The quick brown fox jumps over the lazy dog 0123456789'
+
+
+def find_fonts():
+    dirs = os.environ.get('PDFLIB_BENCH_FONTS')
+    dirs = dirs.split(os.pathsep) if dirs else FONT_DIRS
+    found = []
+    for directory in dirs:
+        for root, subdirs, files in os.walk(directory):
+            subdirs.sort()
+            for name in sorted(files):
+                if name.lower().endswith('.ttf'):
+                    found.append(os.path.join(root, name))
+                    if len(found) == FONT_COUNT:
+                        return found
+    return found
+
+
+FONTS = find_fonts()
+
+
+def render(p):
+    if not FONTS:
+        raise RuntimeError('No TrueType fonts found, point PDFLIB_BENCH_FONTS at a directory of .ttf files')
+    fonts = []
+    for i, path in enumerate(FONTS):
+        name = 'benchfont%d' % i
+        p.set_option('FontOutline={%s={%s}}' % (name, path))
+        fonts.append(p.load_font(name, 'unicode', ''))
+
+    for _ in range(PAGES):
+        p.begin_page_ext(595, 842, '')
+        y = 792
+        for font in fonts:
+            for size in (8, 12, 18):
+                p.fit_textline(SAMPLE, 50, y, {'font': font, 'fontsize': size})
+                y -= size * 1.5
+        p.end_page_ext('')
+
+    for font in fonts:
+        p.close_font(font)
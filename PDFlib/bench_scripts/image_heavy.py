@@ -0,0 +1,55 @@
+"""Image-heavy workload: generated raw RGB images, plus any JPEG/PNG/TIFF files found in
+PDFLIB_BENCH_IMAGES to exercise image passthrough of already compressed data.
+
+Pixel data is generated at import time, outside the timed section.
+"""
+import os
+
+SIZE = 256
+COUNT = 12
+IMAGE_EXTENSIONS = ('.jpg', '.jpeg', '.png', '.tif', '.tiff')
+
+
+def generate(seed):
+    rows = []
+    for y in range(SIZE):
+        rows.append(bytes(
+            channel
+            for x in range(SIZE)
+            for channel in ((x + seed * 17) & 255, (y * 3 + seed) & 255, (x * y + seed) & 255)
+        ))
+    return b''.join(rows)
+
+
+def find_images():
+    directory = os.environ.get('PDFLIB_BENCH_IMAGES')
+    if not directory:
+        return []
+    return [
+        os.path.join(directory, name) for name in sorted(os.listdir(directory))
+        if name.lower().endswith(IMAGE_EXTENSIONS)
+    ]
+
+
+RAW_IMAGES = [generate(seed) for seed in range(COUNT)]
+IMAGE_FILES = find_images()
+
+
+def render(p):
+    images = []
+    for i, data in enumerate(RAW_IMAGES):
+        filename = '/pvf/bench/image%d' % i
+        p.create_pvf(filename, data, '')
+        images.append(p.load_image('raw', filename, {'width': SIZE, 'height': SIZE, 'components': 3, 'bpc': 8}))
+    for filename in IMAGE_FILES:
+        images.append(p.load_image('auto', filename, ''))
+
+    for image in images:
+        p.begin_page_ext(595, 842, '')
+        p.fit_image(image, 50, 50, 'boxsize={495 742} fitmethod=meet')
+        p.end_page_ext('')
+
+    for image in images:
+        p.close_image(image)
+    for i in range(len(RAW_IMAGES)):
+        p.delete_pvf('/pvf/bench/image%d' % i)
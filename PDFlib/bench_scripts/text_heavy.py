@@ -0,0 +1,20 @@
+"""Text-heavy workload: long paragraphs in a core font flowed across many A4 pages"""
+
+PARAGRAPH = (
+    'Lorem ipsum dolor sit amet, consectetur adipiscing elit, sed do eiusmod tempor incididunt ut '
+    'labore et dolore magna aliqua. Ut enim ad minim veniam, quis nostrud exercitation ullamco '
+    'laboris nisi ut aliquip ex ea commodo consequat. Duis aute irure dolor in reprehenderit in '
+    'voluptate velit esse cillum dolore eu fugiat nulla pariatur. '
+)
+PARAGRAPHS = 400
+
+
+def render(p):
+    text = '\n'.join([PARAGRAPH * 3] * PARAGRAPHS)
+    textflow = p.create_textflow(text, 'fontname=Helvetica encoding=unicode fontsize=10 leading=125%')
+    result = '_boxfull'
+    while result in ('_boxfull', '_nextpage'):
+        p.begin_page_ext(595, 842, '')
+        result = p.fit_textflow(textflow, 50, 50, 545, 792, '')
+        p.end_page_ext('')
+    p.delete_textflow(textflow)
@@ -0,0 +1,79 @@
+import sys
+import types
+
+import pytest
+
+
+class StubBinding(types.ModuleType):
+    """Stand-in for the compiled pdflib_py extension which records every call"""
+
+    def __init__(self):
+        super().__init__('PDFlib.pdflib_py')
+        self.calls = []
+        self.options = {'compress': 6.0}
+        self.begin_document_result = 1
+
+        class PDFlibException(Exception):
+            pass
+
+        self.PDFlibException = PDFlibException
+        self.__all__ = ['PDFlibException']
+        for name in ['PDF_new', 'PDF_delete', 'PDF_set_option', 'PDF_get_option', 'PDF_begin_document',
+                     'PDF_end_document', 'PDF_get_buffer', 'PDF_load_font', 'PDF_load_image',
+                     'PDF_fit_textline', 'PDF_create_textflow', 'PDF_set_text_option']:
+            setattr(self, name, getattr(self, '_' + name))
+            self.__all__.append(name)
+
+    def _PDF_new(self):
+        return 1
+
+    def _PDF_delete(self, p):
+        pass
+
+    def _PDF_set_option(self, p, optlist):
+        self.calls.append(('set_option', optlist))
+
+    def _PDF_get_option(self, p, keyword, optlist):
+        try:
+            return self.options[keyword]
+        except KeyError:
+            raise self.PDFlibException('Unknown keyword %s' % keyword) from None
+
+    def _PDF_begin_document(self, p, filename, optlist):
+        self.calls.append(('begin_document', optlist))
+        return self.begin_document_result
+
+    def _PDF_end_document(self, p, optlist):
+        self.calls.append(('end_document', optlist))
+
+    def _PDF_get_buffer(self, p):
+        return b'%PDF-1.7 stub'
+
+    def _PDF_load_font(self, p, fontname, encoding, optlist):
+        self.calls.append(('load_font', optlist))
+        return 1
+
+    def _PDF_load_image(self, p, imagetype, filename, optlist):
+        self.calls.append(('load_image', optlist))
+        return 1
+
+    def _PDF_fit_textline(self, p, text, x, y, optlist):
+        self.calls.append(('fit_textline', optlist))
+
+    def _PDF_create_textflow(self, p, text, optlist):
+        self.calls.append(('create_textflow', optlist))
+        return 1
+
+    def _PDF_set_text_option(self, p, optlist):
+        self.calls.append(('set_text_option', optlist))
+
+
+stub = StubBinding()
+sys.modules['PDFlib.pdflib_py'] = stub
+
+
+@pytest.fixture
+def calls():
+    stub.calls.clear()
+    stub.begin_document_result = 1
+    return stub.calls
@@ -0,0 +1,75 @@
+import glob
+import os
+import runpy
+
+import pytest
+
+from PDFlib import bench
+
+
+@pytest.fixture
+def script(tmp_path):
+    path = tmp_path / 'script.py'
+    path.write_text("def render(p):\n    p.load_font('DejaVuSans', 'unicode', '')\n")
+    return str(path)
+
+
+def test_run_script(script, calls):
+    result = bench.run_script(script, 'archive')
+    assert result['bytes'] == len(b'%PDF-1.7 stub')
+    assert result['seconds'] >= 0
+    assert ('load_font', 'embedding=true subsetting=false') in calls
+    assert calls[-2:] == [('end_document', ''), ('set_option', 'compress=6')]
+
+
+def test_format_table():
+    table = bench.format_table([
+        {'script': '/x/text.py', 'profile': 'fast', 'seconds': 0.0123, 'peak_rss': 20 * 1024 * 1024,
+         'bytes': 2048, 'bytes_max': 2048},
+        {'script': '/x/images.py', 'profile': 'smallest', 'seconds': 1.5, 'peak_rss': None,
+         'bytes': 1024, 'bytes_max': 3072},
+    ])
+    assert table.split('\n') == [
+        'script     profile   time (ms)  peak RSS (MiB)  output (KiB)',
+        '---------  --------  ---------  --------------  ------------',
+        'text.py    fast           12.3            20.0           2.0',
+        'images.py  smallest     1500.0               -       1.0-3.0',
+    ]
+
+
+@pytest.mark.parametrize('argv, message', [
+    (['missing.py'], 'could not load missing.py'),
+    (['--repeat', '0'], '--repeat must be at least 1'),
+])
+def test_main_errors(argv, message, capsys):
+    with pytest.raises(SystemExit):
+        bench.main(argv)
+    assert message in capsys.readouterr().err
+
+
+def test_main_script_without_render(tmp_path, capsys):
+    path = tmp_path / 'empty.py'
+    path.write_text('x = 1\n')
+    with pytest.raises(SystemExit):
+        bench.main([str(path)])
+    assert 'does not define render(p)' in capsys.readouterr().err
+
+
+def test_main_defaults_to_bundled_corpus(monkeypatch, capsys):
+    seen = {}
+
+    def benchmark(scripts, profiles, repeat):
+        seen.update(scripts=scripts, profiles=profiles, repeat=repeat)
+        return []
+
+    monkeypatch.setattr(bench, 'benchmark', benchmark)
+    bench.main(['--json'])
+    assert seen['scripts'] == sorted(glob.glob(os.path.join(bench.BENCH_SCRIPTS, '*.py')))
+    assert [os.path.basename(s) for s in seen['scripts']] == ['font_heavy.py', 'image_heavy.py', 'text_heavy.py']
+    assert seen['profiles'] == ['fast', 'balanced', 'smallest', 'archive']
+    assert capsys.readouterr().out.strip() == '[]'
+
+
+def test_bundled_scripts_define_render():
+    for script in glob.glob(os.path.join(bench.BENCH_SCRIPTS, '*.py')):
+        assert callable(runpy.run_path(script)['render'])
@@ -0,0 +1,180 @@
+import pytest
+
+from PDFlib import PDFlib, PDFlibException, OutputProfile, optlist_items, optlist_keys
+from conftest import stub
+
+
+PROFILE = OutputProfile(
+    'test',
+    document={'objectstreams': 'none'},
+    option={'compress': 9},
+    font={'embedding': True, 'subsetting': False},
+    image={'passthrough': True},
+)
+
+
+@pytest.fixture
+def p(calls):
+    """PDFlib instance using PROFILE, with the constructor's own calls discarded"""
+    pdf = PDFlib(PROFILE)
+    calls.clear()
+    return pdf
+
+
+@pytest.mark.parametrize('optlist, keys', [
+    ('', []),
+    ('embedding=true subsetting=false', ['embedding', 'subsetting']),
+    ('embedding false', ['embedding']),
+    ('passthrough = true', ['passthrough']),
+    ('embedding subsetting=false', ['embedding', 'subsetting']),
+    ('subsetting=false embedding', ['subsetting', 'embedding']),
+    # Ambiguous: a bare boolean followed by another bare word is read as key and value
+    ('embedding subsetting', ['embedding']),
+    ('Embedding=false SubSetting false', ['embedding', 'subsetting']),
+    ('fallbackfonts={{fontname=X encoding=unicode subsetting=true}}', ['fallbackfonts']),
+    ('fontname {Some Font} embedding', ['fontname', 'embedding']),
+    ({'Embedding': True}, ['embedding']),
+])
+def test_optlist_keys(optlist, keys):
+    assert optlist_keys(optlist) == keys
+
+
+def test_optlist_items():
+    assert optlist_items('FontName={Some Font} encoding unicode embedding') == [
+        ('fontname', '{Some Font}'),
+        ('encoding', 'unicode'),
+        ('embedding', None),
+    ]
+    assert optlist_items({'fontsize': 12, 'embedding': True}) == [('fontsize', '12'), ('embedding', 'true')]
+
+
+@pytest.mark.parametrize('optlist, expected', [
+    ('', 'embedding=true subsetting=false'),
+    ({'subsetting': True}, 'embedding=true subsetting=true'),
+    ('embedding false', 'subsetting=false embedding false'),
+    ('Embedding=false', 'subsetting=false Embedding=false'),
+    ('fallbackfonts={{fontname=X encoding=unicode subsetting=true}}',
+     'embedding=true subsetting=false fallbackfonts={{fontname=X encoding=unicode subsetting=true}}'),
+])
+def test_profile_optlist(p, optlist, expected):
+    assert p.profile_optlist('font', optlist) == expected
+
+
+def test_profile_optlist_without_profile():
+    p = PDFlib()
+    assert p.profile_optlist('font', 'embedding=false') == 'embedding=false'
+    assert p._profile_options('font', '') == []
+
+
+def test_unknown_profile():
+    with pytest.raises(ValueError):
+        PDFlib('nope')
+
+
+@pytest.mark.parametrize('option', [{'textformat': 'utf8'}, {'usehypertextencoding': False}])
+def test_profile_rejects_non_numeric_options(option):
+    with pytest.raises(TypeError):
+        OutputProfile('test', option=option)
+
+
+def test_begin_document_applies_profile(p, calls):
+    p.begin_document('', '')
+    p.end_document('')
+    assert calls == [
+        ('begin_document', 'objectstreams=none'),
+        ('set_option', 'compress=9'),
+        ('end_document', ''),
+        ('set_option', 'compress=6'),
+    ]
+
+
+def test_begin_document_failure(p, calls):
+    stub.begin_document_result = -1
+    assert p.begin_document('', '') == -1
+    assert calls == [('begin_document', 'objectstreams=none')]
+
+    # No document is open, so nothing is left to restore
+    stub.begin_document_result = 1
+    calls.clear()
+    p.begin_document('', '')
+    assert calls == [('begin_document', 'objectstreams=none'), ('set_option', 'compress=9')]
+
+
+def test_unreadable_option_leaves_document_unopened(calls):
+    p = PDFlib(OutputProfile('test', option={'compress': 9, 'nosuchoption': 1}))
+    calls.clear()
+    with pytest.raises(PDFlibException):
+        p.begin_document('', '')
+    assert calls == []
+
+
+def test_begin_document_optlist_wins(p, calls):
+    p.begin_document('', 'Compress=2 objectstreams {other}')
+    assert calls == [('begin_document', 'Compress=2 objectstreams {other}')]
+
+
+def test_set_option_wins(p, calls):
+    p.set_option('COMPRESS=0')
+    p.begin_document('', '')
+    p.end_document('')
+    assert calls == [
+        ('set_option', 'COMPRESS=0'),
+        ('begin_document', 'objectstreams=none'),
+        ('end_document', ''),
+    ]
+
+
+def test_set_option_inside_document_is_not_reverted(p, calls):
+    p.begin_document('', '')
+    p.set_option('compress=3')
+    p.end_document('')
+    assert calls[-1] == ('end_document', '')
+
+
+def test_profile_options_reverted_for_next_document(p, calls):
+    p.begin_document('', '')
+    p.end_document('')
+    p.use_profile(None)
+    calls.clear()
+    p.begin_document('', '')
+    assert calls == [('begin_document', '')]
+
+
+def test_use_profile_inside_document_waits_for_next_document(calls):
+    p = PDFlib()
+    p.begin_document('', '')
+    p.use_profile(PROFILE)
+    p.load_font('DejaVuSans', 'unicode', '')
+    p.load_image('auto', 'image.jpg', '')
+    p.end_document('')
+    assert ('load_font', '') in calls
+    assert ('load_image', '') in calls
+
+    calls.clear()
+    p.begin_document('', '')
+    p.load_image('auto', 'image.jpg', '')
+    assert calls[-1] == ('load_image', 'passthrough=true')
+
+
+def test_core_fonts_not_forced_to_embed(p, calls):
+    p.load_font('Helvetica', 'unicode', '')
+    p.load_font('DejaVuSans', 'unicode', '')
+    assert calls == [
+        ('load_font', ''),
+        ('load_font', 'embedding=true subsetting=false'),
+    ]
+
+
+def test_implicit_font_loading(p, calls):
+    p.fit_textline('text', 0, 0, 'fontname=DejaVuSans encoding=unicode fontsize=12')
+    p.fit_textline('text', 0, 0, {'fontname': 'Helvetica', 'encoding': 'unicode', 'fontsize': 12})
+    p.fit_textline('text', 0, 0, 'font=1 fontsize=12')
+    p.create_textflow('text', 'fontname={DejaVu Sans} encoding=unicode embedding=false')
+    p.set_text_option('fontname=DejaVuSans encoding=unicode')
+    assert calls == [
+        ('fit_textline', 'embedding=true subsetting=false fontname=DejaVuSans encoding=unicode fontsize=12'),
+        ('fit_textline', 'fontname=Helvetica encoding=unicode fontsize=12'),
+        ('fit_textline', 'font=1 fontsize=12'),
+        ('create_textflow', 'subsetting=false fontname={DejaVu Sans} encoding=unicode embedding=false'),
+        ('set_text_option', 'embedding=true subsetting=false fontname=DejaVuSans encoding=unicode'),
+    ]